@@ -0,0 +1,88 @@
+"""Compare the old per-row /api/logs serialization with the columnar path
+
+Run from the repository root:  python benchmarks/bench_serialization.py
+"""
+import gzip
+import json
+import os
+import random
+import sqlite3
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from serialization import rows_to_records, rows_to_columns, dumps
+
+ROWS = 100  # /api/logs caps limit at 100
+REPEAT = 2000
+
+
+def make_rows():
+    random.seed(0)
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute('CREATE TABLE predictions (id INTEGER PRIMARY KEY, timestamp TEXT, gene1 REAL, gene2 REAL, '
+                 'gene3 REAL, gene4 REAL, gene5 REAL, prediction_numeric INTEGER, prediction_label TEXT, true_label TEXT)')
+    for i in range(ROWS):
+        conn.execute('INSERT INTO predictions VALUES (?,?,?,?,?,?,?,?,?,?)',
+                     (i + 1, f'2025-01-01T00:{i // 60:02d}:{i % 60:02d}.123456',
+                      *[random.uniform(-5, 5) for _ in range(5)], i % 2,
+                      'Positive' if i % 2 else 'Negative', random.choice([None, 'Positive', 'Negative'])))
+    return conn.execute('SELECT * FROM predictions').fetchall()
+
+
+def old_serialize(rows):
+    """Per-row dicts + compact sorted json, as Flask's jsonify produced them"""
+    predictions = []
+    for row in rows:
+        row_dict = dict(row)
+        predictions.append({
+            'id': row_dict['id'],
+            'timestamp': row_dict['timestamp'],
+            'gene1': round(float(row_dict['gene1']), 4),
+            'gene2': round(float(row_dict['gene2']), 4),
+            'gene3': round(float(row_dict['gene3']), 4),
+            'gene4': round(float(row_dict['gene4']), 4),
+            'gene5': round(float(row_dict['gene5']), 4),
+            'prediction_numeric': row_dict['prediction_numeric'],
+            'prediction_label': row_dict['prediction_label'],
+            'true_label': row_dict['true_label']
+        })
+    payload = {"status": "success", "count": len(predictions), "data": predictions}
+    return json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def records_serialize(rows):
+    predictions = rows_to_records(rows)
+    return dumps({"status": "success", "count": len(predictions), "data": predictions})
+
+
+def columns_serialize(rows):
+    columns = rows_to_columns(rows)
+    return dumps({"status": "success", "count": len(columns['id']),
+                  "columns": list(columns), "data": list(columns.values())})
+
+
+def peak_bytes(func, rows):
+    tracemalloc.start()
+    func(rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    rows = make_rows()
+    print(f"{ROWS} rows, {REPEAT} iterations")
+    print(f"{'path':<10} {'us/call':>9} {'peak KB':>8} {'body B':>8} {'gzip B':>8}")
+    for name, func in (('old', old_serialize), ('records', records_serialize), ('columns', columns_serialize)):
+        seconds = timeit.timeit(lambda: func(rows), number=REPEAT)
+        body = func(rows)
+        print(f"{name:<10} {seconds / REPEAT * 1e6:>9.1f} {peak_bytes(func, rows) / 1024:>8.1f} "
+              f"{len(body):>8} {len(gzip.compress(body, compresslevel=6)):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from datetime import datetime
 import os
 import sqlite3
 from db import get_db_connection, execute_query
+from serialization import rows_to_records, rows_to_columns, dumps, choose_encoding, compress
 
 app = Flask(__name__)
 
@@ -62,56 +63,35 @@ def log_prediction(gene_values, prediction, prediction_label, true_label=None):
         print(f"✗ Error logging prediction: {e}")
         return False
 
-def get_predictions_from_db(limit=50):
-    """Get predictions from database"""
+def get_prediction_rows_from_db(limit=50):
+    """Get raw prediction rows from database, newest first"""
     try:
         query = '''
             SELECT id, timestamp, gene1, gene2, gene3, gene4, gene5, prediction_numeric, prediction_label, true_label
             FROM predictions ORDER BY timestamp DESC LIMIT %s
         '''
-        rows = execute_query(query, (limit,), fetch=True)
-        
-        # Convert to list of dictionaries for easier template rendering
-        predictions = []
-        for row in rows:
-            try:
-                # Handle both SQLite Row objects and PostgreSQL tuples
-                if hasattr(row, 'keys'):  # SQLite Row object
-                    row_dict = dict(row)
-                    predictions.append({
-                        'id': row_dict['id'],
-                        'timestamp': row_dict['timestamp'],
-                        'gene1': round(float(row_dict['gene1']), 4),
-                        'gene2': round(float(row_dict['gene2']), 4),
-                        'gene3': round(float(row_dict['gene3']), 4),
-                        'gene4': round(float(row_dict['gene4']), 4),
-                        'gene5': round(float(row_dict['gene5']), 4),
-                        'prediction_numeric': row_dict['prediction_numeric'],
-                        'prediction_label': row_dict['prediction_label'],
-                        'true_label': row_dict['true_label']
-                    })
-                else:  # PostgreSQL tuple
-                    predictions.append({
-                        'id': row[0],
-                        'timestamp': row[1].strftime('%Y-%m-%d %H:%M:%S') if hasattr(row[1], 'strftime') else str(row[1]),
-                        'gene1': round(float(row[2]), 4),
-                        'gene2': round(float(row[3]), 4),
-                        'gene3': round(float(row[4]), 4),
-                        'gene4': round(float(row[5]), 4),
-                        'gene5': round(float(row[6]), 4),
-                        'prediction_numeric': row[7],
-                        'prediction_label': row[8],
-                        'true_label': row[9]
-                    })
-            except Exception as e:
-                print(f"Error processing row: {e}")
-                continue
-        
-        return predictions
+        return execute_query(query, (limit,), fetch=True) or []
     except Exception as e:
         print(f"✗ Error fetching predictions: {e}")
         return []
 
+def get_predictions_from_db(limit=50):
+    """Get predictions from database"""
+    # List of dictionaries for easier template rendering
+    return rows_to_records(get_prediction_rows_from_db(limit=limit))
+
+def json_response(payload, status=200):
+    """Build a JSON response with the fast encoder and negotiated compression"""
+    body = dumps(payload)
+    encoding = choose_encoding(request.accept_encodings, len(body))
+    response = app.response_class(compress(body, encoding),
+                                  status=status,
+                                  mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
 def get_prediction_stats():
     """Get statistics for dashboard"""
     try:
@@ -176,7 +156,7 @@ def predict():
         if model is None:
             error_msg = "ML Model not available. Please contact administrator."
             if request.content_type == 'application/json':
-                return jsonify({"error": error_msg}), 500
+                return json_response({"error": error_msg}, 500)
             return render_template("error.html", error=error_msg), 500
             
         # Extract gene values
@@ -188,7 +168,7 @@ def predict():
             except (KeyError, ValueError, TypeError) as e:
                 error_msg = f"Invalid or missing value for Gene {i}"
                 if request.content_type == 'application/json':
-                    return jsonify({"error": error_msg}), 400
+                    return json_response({"error": error_msg}, 400)
                 return render_template("error.html", error=error_msg), 400
 
         true_label = request.form.get('true_label', None)
@@ -205,7 +185,7 @@ def predict():
 
         # Return appropriate response
         if request.content_type == 'application/json':
-            return jsonify({
+            return json_response({
                 "prediction": prediction_label,
                 "prediction_numeric": int(pred),
                 "genes": gene_values,
@@ -223,7 +203,7 @@ def predict():
         print(f"✗ Prediction error: {e}")
         error_msg = "An error occurred during prediction"
         if request.content_type == 'application/json':
-            return jsonify({"error": error_msg, "details": str(e)}), 500
+            return json_response({"error": error_msg, "details": str(e)}, 500)
         return render_template("error.html", error=error_msg), 500
 
 @app.route("/dashboard")
@@ -258,35 +238,46 @@ def history():
 
 @app.route("/api/logs")
 def api_logs():
-    """API endpoint for logs (JSON)"""
+    """API endpoint for logs (JSON)
+
+    Pass ?format=columns for the compact shape with one array per column.
+    """
     try:
         limit = min(request.args.get('limit', 20, type=int), 100)  # Cap at 100
+        if request.args.get('format') == 'columns':
+            columns = rows_to_columns(get_prediction_rows_from_db(limit=limit))
+            return json_response({
+                "status": "success",
+                "count": len(columns['id']),
+                "columns": list(columns),
+                "data": list(columns.values())
+            })
         predictions = get_predictions_from_db(limit=limit)
-        return jsonify({
+        return json_response({
             "status": "success",
             "count": len(predictions),
             "data": predictions
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route("/api/stats")
 def api_stats():
     """API endpoint for statistics (JSON)"""
     try:
         stats = get_prediction_stats()
-        return jsonify({
+        return json_response({
             "status": "success",
             "data": stats
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route("/health")
 def health_check():
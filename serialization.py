@@ -0,0 +1,153 @@
+import gzip
+import json
+import math
+from datetime import date
+from decimal import Decimal
+
+# Optional fast JSON encoder - falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Brotli compression - gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Column order matches the SELECT in get_prediction_rows_from_db
+PREDICTION_COLUMNS = (
+    'id', 'timestamp', 'gene1', 'gene2', 'gene3', 'gene4', 'gene5',
+    'prediction_numeric', 'prediction_label', 'true_label'
+)
+GENE_COLUMNS = ('gene1', 'gene2', 'gene3', 'gene4', 'gene5')
+
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES = 1024
+
+def format_timestamp(value):
+    """Format a database timestamp the same way for SQLite and PostgreSQL"""
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return value if value is None or isinstance(value, str) else str(value)
+
+def _convert_row(row):
+    """Convert a single cursor row to output values, raising on bad data"""
+    values = list(row)
+    values[1] = format_timestamp(values[1])
+    for i in range(2, 7):
+        values[i] = round(float(values[i]), 4)
+    return values
+
+def rows_to_records(rows):
+    """Convert cursor rows straight into one dict per row, skipping bad rows"""
+    records = []
+    for row in rows:
+        try:
+            # sqlite3.Row and psycopg2 tuples both unpack positionally
+            (row_id, timestamp, gene1, gene2, gene3, gene4, gene5,
+             prediction_numeric, prediction_label, true_label) = row
+            records.append({
+                'id': row_id,
+                'timestamp': format_timestamp(timestamp),
+                'gene1': round(float(gene1), 4),
+                'gene2': round(float(gene2), 4),
+                'gene3': round(float(gene3), 4),
+                'gene4': round(float(gene4), 4),
+                'gene5': round(float(gene5), 4),
+                'prediction_numeric': prediction_numeric,
+                'prediction_label': prediction_label,
+                'true_label': true_label
+            })
+        except Exception as e:
+            print(f"Error processing row: {e}")
+            continue
+    return records
+
+def rows_to_columns(rows):
+    """Transpose cursor rows into one list per column without building row dicts"""
+    if not rows:
+        return {name: [] for name in PREDICTION_COLUMNS}
+
+    try:
+        # Fast path: sqlite3.Row and psycopg2 tuples both support positional access
+        columns = dict(zip(PREDICTION_COLUMNS, map(list, zip(*rows))))
+        columns['timestamp'] = [format_timestamp(ts) for ts in columns['timestamp']]
+        for name in GENE_COLUMNS:
+            columns[name] = [round(float(value), 4) for value in columns[name]]
+        return columns
+    except Exception:
+        pass
+
+    # Slow path: convert row by row and skip only the rows that fail
+    converted = []
+    for row in rows:
+        try:
+            converted.append(_convert_row(row))
+        except Exception as e:
+            print(f"Error processing row: {e}")
+            continue
+    if not converted:
+        return {name: [] for name in PREDICTION_COLUMNS}
+    return dict(zip(PREDICTION_COLUMNS, map(list, zip(*converted))))
+
+def _default(value):
+    """Encode types JSON does not support natively, like Flask's provider does"""
+    if isinstance(value, date):
+        return format_timestamp(value) if hasattr(value, 'hour') else value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _finite(value):
+    """Replace NaN and infinity with None so the output stays valid JSON"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+def dumps(payload):
+    """Encode payload to compact UTF-8 JSON bytes, using orjson when installed
+
+    Both encoders sort keys, write NaN/infinity as null and format
+    datetimes and Decimals the same way. Other output can still differ
+    (orjson writes 1e-7 where json writes 1e-07, and rejects non-string
+    keys and integers wider than 64 bits).
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    try:
+        text = json.dumps(payload, default=_default, sort_keys=True, allow_nan=False,
+                          separators=(',', ':'), ensure_ascii=False)
+    except ValueError:
+        text = json.dumps(_finite(payload), default=_default, sort_keys=True,
+                          separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
+def choose_encoding(accept_encodings, size):
+    """Pick the best supported Content-Encoding for a body of the given size
+
+    The client's q-values decide; brotli only wins a tie.
+    """
+    if size < COMPRESSION_MIN_BYTES:
+        return None
+    gzip_quality = accept_encodings.quality('gzip')
+    br_quality = accept_encodings.quality('br') if brotli is not None else 0
+    if br_quality > 0 and br_quality >= gzip_quality:
+        return 'br'
+    if gzip_quality > 0:
+        return 'gzip'
+    return None
+
+def compress(body, encoding):
+    """Compress body with the negotiated encoding"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6)
+    return body
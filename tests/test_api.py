@@ -0,0 +1,55 @@
+import gzip
+import json
+
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('psycopg2')
+
+import run
+from tests.test_serialization import make_rows
+
+
+@pytest.fixture
+def client(monkeypatch):
+    rows = make_rows(50)
+    monkeypatch.setattr(run, 'execute_query', lambda query, params=None, fetch=False: rows)
+    return run.app.test_client()
+
+
+def test_logs_records_shape(client):
+    body = client.get('/api/logs?limit=50').get_json()
+    assert body['status'] == 'success'
+    assert body['count'] == 50
+    assert body['data'][0]['id'] == 1
+
+
+def test_logs_columns_shape(client):
+    body = client.get('/api/logs?limit=50&format=columns').get_json()
+    assert body['columns'][0] == 'id'
+    assert len(body['data']) == len(body['columns'])
+    assert body['data'][body['columns'].index('gene2')][0] == 1.2346
+
+
+def test_logs_negotiates_gzip(client):
+    response = client.get('/api/logs?limit=50', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert json.loads(gzip.decompress(response.data))['count'] == 50
+
+
+def test_vary_keeps_existing_values(client, monkeypatch):
+    class CookieVaryResponse(run.app.response_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.vary.add('Cookie')
+
+    monkeypatch.setattr(run.app, 'response_class', CookieVaryResponse)
+    response = client.get('/api/logs?limit=50', headers={'Accept-Encoding': 'gzip'})
+    assert set(response.vary) == {'Accept-Encoding', 'Cookie'}
+
+
+def test_logs_uncompressed_without_accept_encoding(client):
+    response = client.get('/api/logs?limit=50')
+    assert 'Content-Encoding' not in response.headers
+    assert response.headers['Vary'] == 'Accept-Encoding'
@@ -0,0 +1,157 @@
+import gzip
+import json
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+import serialization
+from serialization import (PREDICTION_COLUMNS, COMPRESSION_MIN_BYTES, rows_to_records,
+                           rows_to_columns, dumps, choose_encoding, compress)
+
+
+class Accept:
+    """Minimal stand-in for werkzeug's Accept-Encoding header object"""
+    def __init__(self, **qualities):
+        self.qualities = qualities
+
+    def quality(self, key):
+        return self.qualities.get(key, 0)
+
+
+def make_rows(count=20, bad_gene1=None):
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute('''
+        CREATE TABLE predictions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+            gene1 REAL NOT NULL, gene2 REAL NOT NULL, gene3 REAL NOT NULL,
+            gene4 REAL NOT NULL, gene5 REAL NOT NULL,
+            prediction_numeric INTEGER NOT NULL, prediction_label TEXT NOT NULL,
+            true_label TEXT
+        )
+    ''')
+    for i in range(count):
+        conn.execute('INSERT INTO predictions (timestamp, gene1, gene2, gene3, gene4, gene5, '
+                     'prediction_numeric, prediction_label, true_label) VALUES (?,?,?,?,?,?,?,?,?)',
+                     (f'2025-01-01T00:00:{i:02d}', i / 3, 1.23456, -2.5, 0.0, 10 + i / 7,
+                      i % 2, 'Positive' if i % 2 else 'Negative', None if i % 3 else 'Positive'))
+    if bad_gene1 is not None:
+        conn.execute('INSERT INTO predictions (timestamp, gene1, gene2, gene3, gene4, gene5, '
+                     'prediction_numeric, prediction_label, true_label) VALUES (?,?,?,?,?,?,?,?,?)',
+                     ('2025-01-02T00:00:00', bad_gene1, 1, 1, 1, 1, 1, 'Positive', None))
+    rows = conn.execute('SELECT id, timestamp, gene1, gene2, gene3, gene4, gene5, '
+                        'prediction_numeric, prediction_label, true_label FROM predictions').fetchall()
+    conn.close()
+    return rows
+
+
+def old_records(rows):
+    """Per-row conversion as previously done in run.get_predictions_from_db"""
+    predictions = []
+    for row in rows:
+        try:
+            row_dict = dict(row)
+            predictions.append({
+                'id': row_dict['id'],
+                'timestamp': row_dict['timestamp'],
+                'gene1': round(float(row_dict['gene1']), 4),
+                'gene2': round(float(row_dict['gene2']), 4),
+                'gene3': round(float(row_dict['gene3']), 4),
+                'gene4': round(float(row_dict['gene4']), 4),
+                'gene5': round(float(row_dict['gene5']), 4),
+                'prediction_numeric': row_dict['prediction_numeric'],
+                'prediction_label': row_dict['prediction_label'],
+                'true_label': row_dict['true_label']
+            })
+        except Exception:
+            continue
+    return predictions
+
+
+def columns_as_records(columns):
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def test_records_match_old_per_row_output():
+    rows = make_rows()
+    assert rows_to_records(rows) == old_records(rows)
+
+
+def test_columns_match_records():
+    rows = make_rows()
+    assert columns_as_records(rows_to_columns(rows)) == rows_to_records(rows)
+
+
+def test_postgres_tuples_format_timestamps():
+    row = (1, datetime(2025, 1, 2, 3, 4, 5), 1.0, 2.0, 3.0, 4.0, 5.123456, 1, 'Positive', None)
+    columns = rows_to_columns([row])
+    assert columns['timestamp'] == ['2025-01-02 03:04:05']
+    assert columns['gene5'] == [5.1235]
+    assert rows_to_records([row]) == columns_as_records(columns)
+
+
+def test_empty_rows_give_empty_results():
+    assert rows_to_columns([]) == {name: [] for name in PREDICTION_COLUMNS}
+    assert rows_to_records([]) == []
+
+
+def test_bad_row_is_skipped_not_whole_page():
+    rows = make_rows(100, bad_gene1='abc')
+    records = rows_to_records(rows)
+    assert len(records) == 100
+    assert records == old_records(rows)
+    assert columns_as_records(rows_to_columns(rows)) == records
+
+
+def test_dumps_writes_non_finite_floats_as_null():
+    assert json.loads(dumps({'x': float('nan'), 'y': [float('inf'), 1.5]})) == {'x': None, 'y': [None, 1.5]}
+
+
+PAYLOAD = {'b': [1, 2.5, None], 'a': 'é', 'when': datetime(2025, 1, 2, 3, 4, 5),
+           'amount': Decimal('1.10'), 'bad': float('nan'), 'small': 1e-7}
+
+
+def test_dumps_stdlib_encoder(monkeypatch):
+    monkeypatch.setattr(serialization, 'orjson', None)
+    assert dumps(PAYLOAD) == ('{"a":"é","amount":"1.10","b":[1,2.5,null],"bad":null,'
+                              '"small":1e-07,"when":"2025-01-02 03:04:05"}').encode('utf-8')
+
+
+def test_dumps_orjson_encoder_decodes_the_same(monkeypatch):
+    fast = pytest.importorskip('orjson')
+    monkeypatch.setattr(serialization, 'orjson', fast)
+    body = dumps(PAYLOAD)
+    # Same keys, order and values; only float spelling may differ
+    assert body == ('{"a":"é","amount":"1.10","b":[1,2.5,null],"bad":null,'
+                    '"small":1e-7,"when":"2025-01-02 03:04:05"}').encode('utf-8')
+    monkeypatch.setattr(serialization, 'orjson', None)
+    assert json.loads(body) == json.loads(dumps(PAYLOAD))
+
+
+def test_small_bodies_are_not_compressed():
+    assert choose_encoding(Accept(gzip=1, br=1), COMPRESSION_MIN_BYTES - 1) is None
+
+
+def test_gzip_when_only_gzip_accepted():
+    assert choose_encoding(Accept(gzip=1), COMPRESSION_MIN_BYTES) == 'gzip'
+    assert choose_encoding(Accept(), COMPRESSION_MIN_BYTES) is None
+
+
+def test_client_q_values_decide(monkeypatch):
+    monkeypatch.setattr(serialization, 'brotli', object())
+    assert choose_encoding(Accept(br=0.1, gzip=1), COMPRESSION_MIN_BYTES) == 'gzip'
+    assert choose_encoding(Accept(br=1, gzip=0.5), COMPRESSION_MIN_BYTES) == 'br'
+    assert choose_encoding(Accept(br=1, gzip=1), COMPRESSION_MIN_BYTES) == 'br'
+
+
+def test_brotli_ignored_when_not_installed(monkeypatch):
+    monkeypatch.setattr(serialization, 'brotli', None)
+    assert choose_encoding(Accept(br=1, gzip=0.5), COMPRESSION_MIN_BYTES) == 'gzip'
+
+
+def test_gzip_round_trip():
+    body = dumps({'data': list(range(1000))})
+    assert gzip.decompress(compress(body, 'gzip')) == body
+    assert compress(body, None) is body